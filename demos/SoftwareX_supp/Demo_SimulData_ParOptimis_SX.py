@@ -32,7 +32,7 @@ projdata_norm = h5f['projdata_norm'][:]
 proj_angles = h5f['proj_angles'][:]
 h5f.close()
 
-[Vert_det, AnglesNum, Horiz_det] = np.shape(projdata_norm)
+[Vert_det, AnglesNum, Horiz_det] = projdata_norm.shape
 N_size = Vert_det
 
 sliceSel = 128
@@ -43,11 +43,11 @@ plt.imshow(phantom[sliceSel,:,:],vmin=0, vmax=1)
 plt.title('3D Phantom, axial view')
 
 plt.subplot(132)
-plt.imshow(phantom[:,sliceSel,:],vmin=0, vmax=1)
+plt.imshow(np.ascontiguousarray(phantom[:,sliceSel,:]),vmin=0, vmax=1)
 plt.title('3D Phantom, coronal view')
 
 plt.subplot(133)
-plt.imshow(phantom[:,:,sliceSel],vmin=0, vmax=1)
+plt.imshow(np.ascontiguousarray(phantom[:,:,sliceSel]),vmin=0, vmax=1)
 plt.title('3D Phantom, sagittal view')
 plt.show()
 
@@ -33,7 +33,7 @@ projdata_norm = h5f['projdata_norm'][:]
 proj_angles = h5f['proj_angles'][:]
 h5f.close()
 
-[Vert_det, AnglesNum, Horiz_det] = np.shape(projdata_norm)
+[Vert_det, AnglesNum, Horiz_det] = projdata_norm.shape
 N_size = Vert_det
 
 # loading optmisation parameters (the result of running Demo_SimulData_ParOptimis_SX)
@@ -71,7 +71,7 @@ one = plt.imshow(phantom[sliceSel,:,:],vmin=0, vmax=1, interpolation='none', cma
 fig.colorbar(one, ax=ax1)
 plt.title('3D Phantom, axial (X-Y) view')
 plt.subplot(122)
-two = plt.imshow(phantom[:,sliceSel,:],vmin=0, vmax=1,interpolation='none', cmap="PuOr")
+two = plt.imshow(np.ascontiguousarray(phantom[:,sliceSel,:]),vmin=0, vmax=1,interpolation='none', cmap="PuOr")
 fig.colorbar(two, ax=ax2)
 plt.title('3D Phantom, coronal (Y-Z) view')
 """
@@ -41,10 +41,10 @@ Im = Im/255
 perc = 0.05
 u0 = Im + np.random.normal(loc = 0 ,
                                   scale = perc * Im , 
-                                  size = np.shape(Im))
+                                  size = Im.shape)
 u_ref = Im + np.random.normal(loc = 0 ,
                                   scale = 0.01 * Im , 
-                                  size = np.shape(Im))
+                                  size = Im.shape)
 
 # map the u0 u0->u0>0
 # f = np.frompyfunc(lambda x: 0 if x < 0 else x, 1,1)
@@ -123,7 +123,6 @@ plt.title('{}'.format('GPU results'))
 
 print ("--------Compare the results--------")
 tolerance = 1e-05
-diff_im = np.zeros(np.shape(rof_cpu))
 diff_im = abs(rof_cpu - rof_gpu)
 diff_im[diff_im > tolerance] = 1
 a=fig.add_subplot(1,4,4)
@@ -209,7 +208,6 @@ plt.title('{}'.format('GPU results'))
 
 print ("--------Compare the results--------")
 tolerance = 1e-05
-diff_im = np.zeros(np.shape(fgp_cpu))
 diff_im = abs(fgp_cpu - fgp_gpu)
 diff_im[diff_im > tolerance] = 1
 a=fig.add_subplot(1,4,4)
@@ -308,7 +306,6 @@ plt.title('{}'.format('GPU results'))
 
 print ("--------Compare the results--------")
 tolerance = 1e-05
-diff_im = np.zeros(np.shape(pd_cpu))
 diff_im = abs(pd_cpu - pd_gpu)
 diff_im[diff_im > tolerance] = 1
 a=fig.add_subplot(1,4,4)
@@ -390,7 +387,6 @@ plt.title('{}'.format('GPU results'))
 
 print ("--------Compare the results--------")
 tolerance = 1e-05
-diff_im = np.zeros(np.shape(sb_cpu))
 diff_im = abs(sb_cpu - sb_gpu)
 diff_im[diff_im > tolerance] = 1
 a=fig.add_subplot(1,4,4)
@@ -475,7 +471,6 @@ plt.title('{}'.format('GPU results'))
 
 print ("--------Compare the results--------")
 tolerance = 1e-05
-diff_im = np.zeros(np.shape(lltrof_gpu))
 diff_im = abs(lltrof_cpu - lltrof_gpu)
 diff_im[diff_im > tolerance] = 1
 a=fig.add_subplot(1,4,4)
@@ -561,7 +556,6 @@ plt.title('{}'.format('GPU results'))
 
 print ("--------Compare the results--------")
 tolerance = 1e-05
-diff_im = np.zeros(np.shape(tgv_gpu))
 diff_im = abs(tgv_cpu - tgv_gpu)
 diff_im[diff_im > tolerance] = 1
 a=fig.add_subplot(1,4,4)
@@ -648,7 +642,6 @@ plt.title('{}'.format('GPU results'))
 
 print ("--------Compare the results--------")
 tolerance = 1e-05
-diff_im = np.zeros(np.shape(ndf_cpu))
 diff_im = abs(ndf_cpu - ndf_gpu)
 diff_im[diff_im > tolerance] = 1
 a=fig.add_subplot(1,4,4)
@@ -732,7 +725,6 @@ plt.title('{}'.format('GPU results'))
 
 print ("--------Compare the results--------")
 tolerance = 1e-05
-diff_im = np.zeros(np.shape(diff4th_cpu))
 diff_im = abs(diff4th_cpu - diff4th_gpu)
 diff_im[diff_im > tolerance] = 1
 a=fig.add_subplot(1,4,4)
@@ -823,7 +815,6 @@ plt.title('{}'.format('GPU results'))
 
 print ("--------Compare the results--------")
 tolerance = 1e-05
-diff_im = np.zeros(np.shape(fgp_dtv_cpu))
 diff_im = abs(fgp_dtv_cpu - fgp_dtv_gpu)
 diff_im[diff_im > tolerance] = 1
 a=fig.add_subplot(1,4,4)
@@ -877,7 +868,6 @@ print (txtstr)
 
 print ("--------Compare the results--------")
 tolerance = 1e-05
-diff_im = np.zeros(np.shape(u0))
 diff_im = abs(WeightsCPU[0,:,:] - WeightsGPU[0,:,:])
 diff_im[diff_im > tolerance] = 1
 a=fig.add_subplot(1,2,2)
@@ -40,11 +40,11 @@ Im = Im/255
 perc = 0.05
 u0 = Im + np.random.normal(loc = 0 ,
                                   scale = perc * Im , 
-                                  size = np.shape(Im))
+                                  size = Im.shape)
 u_ref = Im + np.random.normal(loc = 0 ,
                                   scale = 0.01 * Im , 
-                                  size = np.shape(Im))
-(N,M) = np.shape(u0)
+                                  size = Im.shape)
+(N,M) = u0.shape
 # map the u0 u0->u0>0
 # f = np.frompyfunc(lambda x: 0 if x < 0 else x, 1,1)
 u0 = u0.astype('float32')
@@ -82,8 +82,8 @@ noisyRef = np.zeros((slices,N,N),dtype='float32')
 idealVol = np.zeros((slices,N,N),dtype='float32')
 
 for i in range (slices):
-    noisyVol[i,:,:] = Im + np.random.normal(loc = 0 , scale = perc * Im , size = np.shape(Im))
-    noisyRef[i,:,:] = Im + np.random.normal(loc = 0 , scale = 0.01 * Im , size = np.shape(Im))
+    noisyVol[i,:,:] = Im + np.random.normal(loc = 0 , scale = perc * Im , size = Im.shape)
+    noisyRef[i,:,:] = Im + np.random.normal(loc = 0 , scale = 0.01 * Im , size = Im.shape)
     idealVol[i,:,:] = Im
 
 #%%
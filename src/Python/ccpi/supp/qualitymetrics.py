@@ -56,7 +56,7 @@ class QualityTools:
             num2 = 2 * sigma12 + c2
             den1 = mu1_sq + mu2_sq + c1
             den2 = sigma1_sq + sigma2_sq + c2
-            ssim_map = np.ones(np.shape(mu1))
+            ssim_map = np.ones(mu1.shape, dtype=np.result_type(num1, num2, den1, den2))
             index = (den1 * den2) > 0
             ssim_map[index] = (num1[index] * num2[index]) / (den1[index] * den2[index])
             index = (den1 != 0) & (den2 == 0)
@@ -0,0 +1,33 @@
+import unittest
+import numpy as np
+from ccpi.supp.qualitymetrics import QualityTools
+###############################################################################
+
+class TestQualityMetrics(unittest.TestCase):
+
+    def getPars(self):
+        np.random.seed(0)
+        im1 = np.random.rand(32,32).astype('float32')
+        im2 = np.random.rand(32,32).astype('float32')
+        window = np.ones((5,5), dtype='float32')
+        return im1,im2,window
+
+    def test_ssim_fallback_float32(self):
+        im1,im2,window = self.getPars()
+        # c1 = 0 switches ssim to the masked fallback branch
+        mssim,ssim_map = QualityTools(im1,im2).ssim(window, k=(0.0, 0.03))
+        ref,ref_map = QualityTools(im1.astype('float64'),im2.astype('float64')).ssim(window.astype('float64'), k=(0.0, 0.03))
+
+        self.assertEqual(ssim_map.dtype, np.float32)
+        self.assertAlmostEqual(mssim,ref,delta=1e-5)
+
+    def test_ssim_fallback_mixed_precision(self):
+        im1,im2,window = self.getPars()
+        mssim,ssim_map = QualityTools(im1,im2.astype('float64')).ssim(window, k=(0.0, 0.03))
+        ref,ref_map = QualityTools(im1.astype('float64'),im2.astype('float64')).ssim(window.astype('float64'), k=(0.0, 0.03))
+
+        self.assertEqual(ssim_map.dtype, np.float64)
+        self.assertAlmostEqual(mssim,ref,delta=1e-6)
+
+if __name__ == '__main__':
+    unittest.main()